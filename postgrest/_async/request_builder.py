@@ -4,7 +4,6 @@ from json import JSONDecodeError
 from typing import Optional, Union
 
 from httpx import Headers, QueryParams
-from pydantic import ValidationError
 
 from ..base_request_builder import (
     APIResponse,
@@ -24,6 +23,16 @@ from ..utils import AsyncClient
 
 
 class AsyncQueryRequestBuilder:
+    __slots__ = (
+        "session",
+        "path",
+        "http_method",
+        "headers",
+        "params",
+        "json",
+        "negate_next",
+    )
+
     def __init__(
         self,
         session: AsyncClient,
@@ -39,6 +48,7 @@ class AsyncQueryRequestBuilder:
         self.headers = headers
         self.params = params
         self.json = json
+        self.negate_next = False
 
     async def execute(self) -> APIResponse:
         """Execute the query.
@@ -64,15 +74,17 @@ class AsyncQueryRequestBuilder:
                 200 <= r.status_code <= 299
             ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
                 return APIResponse.from_http_request_response(r)
-            else:
+            elif r.headers.get("content-type", "").startswith("application/json"):
                 raise APIError(r.json())
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+            else:
+                raise APIError(generate_default_error_message(r))
         except JSONDecodeError as e:
             raise APIError(generate_default_error_message(r))
 
 
 class AsyncSingleRequestBuilder:
+    __slots__ = ("session", "path", "http_method", "headers", "params", "json")
+
     def __init__(
         self,
         session: AsyncClient,
@@ -113,15 +125,17 @@ class AsyncSingleRequestBuilder:
                 200 <= r.status_code <= 299
             ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
                 return SingleAPIResponse.from_http_request_response(r)
-            else:
+            elif r.headers.get("content-type", "").startswith("application/json"):
                 raise APIError(r.json())
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+            else:
+                raise APIError(generate_default_error_message(r))
         except JSONDecodeError as e:
             raise APIError(generate_default_error_message(r))
 
 
 class AsyncMaybeSingleRequestBuilder(AsyncSingleRequestBuilder):
+    __slots__ = ()
+
     async def execute(self) -> Optional[SingleAPIResponse]:
         r = None
         try:
@@ -143,36 +157,12 @@ class AsyncMaybeSingleRequestBuilder(AsyncSingleRequestBuilder):
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class AsyncFilterRequestBuilder(BaseFilterRequestBuilder, AsyncQueryRequestBuilder):  # type: ignore
-    def __init__(
-        self,
-        session: AsyncClient,
-        path: str,
-        http_method: str,
-        headers: Headers,
-        params: QueryParams,
-        json: dict,
-    ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
-        AsyncQueryRequestBuilder.__init__(
-            self, session, path, http_method, headers, params, json
-        )
+    __slots__ = ()
 
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class AsyncSelectRequestBuilder(BaseSelectRequestBuilder, AsyncQueryRequestBuilder):  # type: ignore
-    def __init__(
-        self,
-        session: AsyncClient,
-        path: str,
-        http_method: str,
-        headers: Headers,
-        params: QueryParams,
-        json: dict,
-    ) -> None:
-        BaseSelectRequestBuilder.__init__(self, session, headers, params)
-        AsyncQueryRequestBuilder.__init__(
-            self, session, path, http_method, headers, params, json
-        )
+    __slots__ = ()
 
     def single(self) -> AsyncSingleRequestBuilder:
         """Specify that the query will only return a single row in response.
@@ -227,6 +217,8 @@ class AsyncSelectRequestBuilder(BaseSelectRequestBuilder, AsyncQueryRequestBuild
 
 
 class AsyncRequestBuilder:
+    __slots__ = ("session", "path")
+
     def __init__(self, session: AsyncClient, path: str) -> None:
         self.session = session
         self.path = path
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import warnings
 from typing import Dict, Union, cast
 
-from deprecation import deprecated
 from httpx import Headers, QueryParams, Timeout
 
-from .. import __version__
 from ..base_client import BasePostgrestClient
 from ..constants import (
     DEFAULT_POSTGREST_CLIENT_HEADERS,
+    DEFAULT_POSTGREST_CLIENT_LIMITS,
     DEFAULT_POSTGREST_CLIENT_TIMEOUT,
 )
 from ..utils import SyncClient
 from .request_builder import SyncFilterRequestBuilder, SyncRequestBuilder
 
+_from_table_warned = False
+
 
 class SyncPostgrestClient(BasePostgrestClient):
     """PostgREST client."""
@@ -45,6 +47,7 @@ class SyncPostgrestClient(BasePostgrestClient):
             base_url=base_url,
             headers=headers,
             timeout=timeout,
+            limits=DEFAULT_POSTGREST_CLIENT_LIMITS,
         )
 
     def __enter__(self) -> SyncPostgrestClient:
@@ -65,15 +68,27 @@ class SyncPostgrestClient(BasePostgrestClient):
         Returns:
             :class:`AsyncRequestBuilder`
         """
-        return SyncRequestBuilder(self.session, f"/{table}")
+        return SyncRequestBuilder(self.session, "/" + table)
 
     def table(self, table: str) -> SyncRequestBuilder:
         """Alias to :meth:`from_`."""
         return self.from_(table)
 
-    @deprecated("0.2.0", "1.0.0", __version__, "Use self.from_() instead")
     def from_table(self, table: str) -> SyncRequestBuilder:
-        """Alias to :meth:`from_`."""
+        """Alias to :meth:`from_`.
+
+        .. deprecated:: 0.2.0
+            Use :meth:`from_` instead.
+        """
+        global _from_table_warned
+        if not _from_table_warned:
+            _from_table_warned = True
+            warnings.warn(
+                "from_table is deprecated as of 0.2.0 and will be removed in 1.0.0. "
+                "Use self.from_() instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         return self.from_(table)
 
     def rpc(self, func: str, params: dict) -> SyncFilterRequestBuilder:
@@ -95,5 +110,5 @@ class SyncPostgrestClient(BasePostgrestClient):
         """
         # the params here are params to be sent to the RPC and not the queryparams!
         return SyncFilterRequestBuilder(
-            self.session, f"/rpc/{func}", "POST", Headers(), QueryParams(), json=params
+            self.session, "/rpc/" + func, "POST", Headers(), QueryParams(), json=params
         )
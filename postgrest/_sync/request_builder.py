@@ -4,7 +4,6 @@ from json import JSONDecodeError
 from typing import Optional, Union
 
 from httpx import Headers, QueryParams
-from pydantic import ValidationError
 
 from ..base_request_builder import (
     APIResponse,
@@ -24,6 +23,16 @@ from ..utils import SyncClient
 
 
 class SyncQueryRequestBuilder:
+    __slots__ = (
+        "session",
+        "path",
+        "http_method",
+        "headers",
+        "params",
+        "json",
+        "negate_next",
+    )
+
     def __init__(
         self,
         session: SyncClient,
@@ -39,6 +48,7 @@ class SyncQueryRequestBuilder:
         self.headers = headers
         self.params = params
         self.json = json
+        self.negate_next = False
 
     def execute(self) -> APIResponse:
         """Execute the query.
@@ -64,15 +74,17 @@ class SyncQueryRequestBuilder:
                 200 <= r.status_code <= 299
             ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
                 return APIResponse.from_http_request_response(r)
-            else:
+            elif r.headers.get("content-type", "").startswith("application/json"):
                 raise APIError(r.json())
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+            else:
+                raise APIError(generate_default_error_message(r))
         except JSONDecodeError as e:
             raise APIError(generate_default_error_message(r))
 
 
 class SyncSingleRequestBuilder:
+    __slots__ = ("session", "path", "http_method", "headers", "params", "json")
+
     def __init__(
         self,
         session: SyncClient,
@@ -113,15 +125,17 @@ class SyncSingleRequestBuilder:
                 200 <= r.status_code <= 299
             ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
                 return SingleAPIResponse.from_http_request_response(r)
-            else:
+            elif r.headers.get("content-type", "").startswith("application/json"):
                 raise APIError(r.json())
-        except ValidationError as e:
-            raise APIError(r.json()) from e
+            else:
+                raise APIError(generate_default_error_message(r))
         except JSONDecodeError as e:
             raise APIError(generate_default_error_message(r))
 
 
 class SyncMaybeSingleRequestBuilder(SyncSingleRequestBuilder):
+    __slots__ = ()
+
     def execute(self) -> Optional[SingleAPIResponse]:
         r = None
         try:
@@ -143,36 +157,12 @@ class SyncMaybeSingleRequestBuilder(SyncSingleRequestBuilder):
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncFilterRequestBuilder(BaseFilterRequestBuilder, SyncQueryRequestBuilder):  # type: ignore
-    def __init__(
-        self,
-        session: SyncClient,
-        path: str,
-        http_method: str,
-        headers: Headers,
-        params: QueryParams,
-        json: dict,
-    ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
-        SyncQueryRequestBuilder.__init__(
-            self, session, path, http_method, headers, params, json
-        )
+    __slots__ = ()
 
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder):  # type: ignore
-    def __init__(
-        self,
-        session: SyncClient,
-        path: str,
-        http_method: str,
-        headers: Headers,
-        params: QueryParams,
-        json: dict,
-    ) -> None:
-        BaseSelectRequestBuilder.__init__(self, session, headers, params)
-        SyncQueryRequestBuilder.__init__(
-            self, session, path, http_method, headers, params, json
-        )
+    __slots__ = ()
 
     def single(self) -> SyncSingleRequestBuilder:
         """Specify that the query will only return a single row in response.
@@ -227,6 +217,8 @@ class SyncSelectRequestBuilder(BaseSelectRequestBuilder, SyncQueryRequestBuilder
 
 
 class SyncRequestBuilder:
+    __slots__ = ("session", "path")
+
     def __init__(self, session: SyncClient, path: str) -> None:
         self.session = session
         self.path = path
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import json
+import re
 from json import JSONDecodeError
-from re import search
 from typing import (
     Any,
     Dict,
@@ -18,7 +18,7 @@ from typing import (
 
 from httpx import Headers, QueryParams
 from httpx import Response as RequestResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 try:
     # >= 2.0.0
@@ -27,6 +27,7 @@ except ImportError:
     # < 2.0.0
     from pydantic import validator as field_validator
 
+from .exceptions import APIError
 from .types import CountMethod, Filters, RequestMethod, ReturnMethod
 from .utils import AsyncClient, SyncClient, sanitize_param
 
@@ -114,6 +115,11 @@ def pre_delete(
     return QueryArgs(RequestMethod.DELETE, QueryParams(), headers, {})
 
 
+_COUNT_IN_PREFER_HEADER_PATTERN = re.compile(
+    f"count=({'|'.join([cm.value for cm in CountMethod])})"
+)
+
+
 class APIResponse(BaseModel):
     data: List[Dict[str, Any]]
     """The data returned by the query."""
@@ -136,8 +142,7 @@ class APIResponse(BaseModel):
 
     @staticmethod
     def _is_count_in_prefer_header(prefer_header: str) -> bool:
-        pattern = f"count=({'|'.join([cm.value for cm in CountMethod])})"
-        return bool(search(pattern, prefer_header))
+        return bool(_COUNT_IN_PREFER_HEADER_PATTERN.search(prefer_header))
 
     @classmethod
     def _get_count_from_http_request_response(
@@ -166,7 +171,11 @@ class APIResponse(BaseModel):
         except JSONDecodeError as e:
             return cls(data=[], count=0)
         count = cls._get_count_from_http_request_response(request_response)
-        return cls(data=data, count=count)
+        try:
+            return cls(data=data, count=count)
+        except ValidationError as e:
+            # reuse the already parsed body instead of decoding it again
+            raise APIError(data) from e
 
     @classmethod
     def from_dict(cls: Type[APIResponse], dict: Dict[str, Any]) -> APIResponse:
@@ -187,7 +196,10 @@ class SingleAPIResponse(APIResponse):
     ) -> SingleAPIResponse:
         data = request_response.json()
         count = cls._get_count_from_http_request_response(request_response)
-        return cls(data=data, count=count)
+        try:
+            return cls(data=data, count=count)
+        except ValidationError as e:
+            raise APIError(data) from e
 
     @classmethod
     def from_dict(
@@ -204,16 +216,14 @@ _FilterT = TypeVar("_FilterT", bound="BaseFilterRequestBuilder")
 
 
 class BaseFilterRequestBuilder:
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        self.session = session
-        self.headers = headers
-        self.params = params
-        self.negate_next = False
+    # Filter methods only; the state they mutate (params, headers and
+    # negate_next) is set up by the query builder this is mixed into.
+    __slots__ = ()
+
+    session: Union[AsyncClient, SyncClient]
+    headers: Headers
+    params: QueryParams
+    negate_next: bool
 
     @property
     def not_(self: _FilterT) -> _FilterT:
@@ -401,13 +411,7 @@ class BaseFilterRequestBuilder:
 
 
 class BaseSelectRequestBuilder(BaseFilterRequestBuilder):
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        BaseFilterRequestBuilder.__init__(self, session, headers, params)
+    __slots__ = ()
 
     def explain(
         self: _FilterT,
@@ -1,6 +1,13 @@
+from httpx import Limits
+
 DEFAULT_POSTGREST_CLIENT_HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
 
 DEFAULT_POSTGREST_CLIENT_TIMEOUT = 5
+
+DEFAULT_POSTGREST_CLIENT_LIMITS = Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+)
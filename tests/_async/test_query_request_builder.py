@@ -1,7 +1,8 @@
 import pytest
-from httpx import Headers, QueryParams
+from httpx import Headers, MockTransport, QueryParams, Response
 
 from postgrest import AsyncQueryRequestBuilder
+from postgrest.exceptions import APIError
 from postgrest.utils import AsyncClient
 
 
@@ -21,3 +22,35 @@ def test_constructor(query_request_builder: AsyncQueryRequestBuilder):
     assert len(builder.params) == 0
     assert builder.http_method == "GET"
     assert builder.json == {}
+
+
+@pytest.mark.asyncio
+async def test_execute_error_with_json_body():
+    error = {"message": "mock error", "code": "42P01", "hint": None, "details": None}
+    transport = MockTransport(lambda request: Response(404, json=error))
+    async with AsyncClient(base_url="http://example.com", transport=transport) as client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        with pytest.raises(APIError) as exc_info:
+            await builder.execute()
+    assert exc_info.value.json() == error
+
+
+@pytest.mark.asyncio
+async def test_execute_error_with_non_json_body():
+    transport = MockTransport(
+        lambda request: Response(
+            502,
+            content=b"<html>Bad Gateway</html>",
+            headers={"content-type": "text/html"},
+        )
+    )
+    async with AsyncClient(base_url="http://example.com", transport=transport) as client:
+        builder = AsyncQueryRequestBuilder(
+            client, "/example_table", "GET", Headers(), QueryParams(), {}
+        )
+        with pytest.raises(APIError) as exc_info:
+            await builder.execute()
+    assert exc_info.value.code == 502
+    assert exc_info.value.message == "JSON could not be generated"
@@ -1,3 +1,5 @@
+import sys
+import warnings
 from unittest.mock import patch
 
 import pytest
@@ -5,6 +7,7 @@ from httpx import BasicAuth, Headers
 
 from postgrest import SyncPostgrestClient
 from postgrest.exceptions import APIError
+from postgrest.types import CountMethod
 
 
 @pytest.fixture
@@ -72,6 +75,33 @@ def test_schema(postgrest_client: SyncPostgrestClient):
     assert subheaders.items() < dict(session.headers).items()
 
 
+def test_from_table_warns_once(
+    postgrest_client: SyncPostgrestClient, monkeypatch: pytest.MonkeyPatch
+):
+    module = sys.modules[SyncPostgrestClient.__module__]
+    monkeypatch.setattr(module, "_from_table_warned", False)
+
+    with pytest.warns(DeprecationWarning):
+        builder = postgrest_client.from_table("test")
+    assert builder.path == "/test"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        postgrest_client.from_table("test")
+
+
+def test_builder_headers_are_request_local(postgrest_client: SyncPostgrestClient):
+    builder = (
+        postgrest_client.from_("test").select("a", count=CountMethod.exact).range(0, 10)
+    )
+
+    assert builder.session is postgrest_client.session
+    assert builder.headers["Prefer"] == "count=exact"
+    assert builder.headers["Range"] == "0-9"
+    assert "prefer" not in postgrest_client.session.headers
+    assert "range" not in postgrest_client.session.headers
+
+
 @pytest.mark.asyncio
 def test_params_purged_after_execute(postgrest_client: SyncPostgrestClient):
     assert len(postgrest_client.session.params) == 0
@@ -5,6 +5,7 @@ from httpx import Request, Response
 
 from postgrest import SyncRequestBuilder
 from postgrest.base_request_builder import APIResponse, SingleAPIResponse
+from postgrest.exceptions import APIError
 from postgrest.types import CountMethod
 from postgrest.utils import SyncClient
 
@@ -19,6 +20,20 @@ def test_constructor(request_builder):
     assert request_builder.path == "/example_table"
 
 
+def test_builders_have_no_instance_dict(request_builder: SyncRequestBuilder):
+    builders = [
+        request_builder,
+        request_builder.select("*"),
+        request_builder.select("*").single(),
+        request_builder.select("*").maybe_single(),
+        request_builder.insert({"key": "value"}),
+        request_builder.update({"key": "value"}),
+        request_builder.delete(),
+    ]
+    for builder in builders:
+        assert not hasattr(builder, "__dict__")
+
+
 class TestSelect:
     def test_select(self, request_builder: SyncRequestBuilder):
         builder = request_builder.select("col1", "col2")
@@ -363,6 +378,18 @@ class TestApiResponse:
         assert result.data == api_response
         assert result.count == 2
 
+    def test_from_http_request_response_raises_api_error(
+        self, api_response_with_error: Dict[str, Any]
+    ):
+        response = Response(
+            status_code=200,
+            json=api_response_with_error,
+            request=Request(method="GET", url="http://example.com"),
+        )
+        with pytest.raises(APIError) as exc_info:
+            APIResponse.from_http_request_response(response)
+        assert exc_info.value.json() == api_response_with_error
+
     def test_single_from_http_request_response_constructor(
         self,
         request_response_with_single_data: Response,